@@ -37,6 +37,7 @@ class BaseEmbedderConfig(ABC):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = "us-west-2",
+        max_parallel: Optional[int] = 16,
     ):
         """
         Initializes a configuration class instance for the Embeddings.
@@ -69,6 +70,8 @@ class BaseEmbedderConfig(ABC):
         :type memory_search_embedding_type: Optional[str], optional
         :param lmstudio_base_url: LM Studio base URL to be use, defaults to "http://localhost:1234/v1"
         :type lmstudio_base_url: Optional[str], optional
+        :param max_parallel: Maximum number of concurrent requests used by AWS Bedrock batch embedding, defaults to 16
+        :type max_parallel: Optional[int], optional
         """
 
         self.model = model
@@ -101,3 +104,4 @@ class BaseEmbedderConfig(ABC):
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region
+        self.max_parallel = max_parallel
@@ -50,6 +50,7 @@ class BaseLlmConfig(ABC):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = "us-west-2",
+        performance_config: Optional[str] = None,
     ):
         """
         Initializes a configuration class instance for the LLM.
@@ -102,6 +103,8 @@ class BaseLlmConfig(ABC):
         :type lmstudio_response_format: Optional[Dict], optional
         :param vllm_base_url: vLLM base URL to be use, defaults to "http://localhost:8000/v1"
         :type vllm_base_url: Optional[str], optional
+        :param performance_config: AWS Bedrock latency setting ["standard", "optimized"], defaults to None
+        :type performance_config: Optional[str], optional
         """
 
         self.model = model
@@ -150,3 +153,4 @@ class BaseLlmConfig(ABC):
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region
+        self.performance_config = performance_config
@@ -1,16 +1,24 @@
-import json
 import os
-from typing import Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Literal, Optional
+
+import numpy as np
 
 try:
-    import boto3
+    import orjson
 except ImportError:
-    raise ImportError("The 'boto3' library is required. Please install it using 'pip install boto3'.")
-
-import numpy as np
+    raise ImportError("The 'orjson' library is required. Please install it using 'pip install orjson'.")
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.aws import DEFAULT_MAX_POOL_CONNECTIONS, get_bedrock_client
+
+# Cohere embedding models accept at most 96 texts per request, each up to 2048 characters
+COHERE_MAX_BATCH_SIZE = 96
+COHERE_MAX_TEXT_LENGTH = 2048
+
+# Replaces both CR and LF with spaces in a single pass, independent of the host's line separator
+NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " "})
 
 
 class AWSBedrockEmbedding(EmbeddingBase):
@@ -37,54 +45,51 @@ class AWSBedrockEmbedding(EmbeddingBase):
         if hasattr(self.config, "aws_region"):
             aws_region = self.config.aws_region
 
-        self.client = boto3.client(
-            "bedrock-runtime",
-            region_name=aws_region,
+        # embed_batch sends up to max_parallel requests at once, so the connection pool must be at least that large
+        self.client = get_bedrock_client(
+            aws_region,
             aws_access_key_id=aws_access_key if aws_access_key else None,
             aws_secret_access_key=aws_secret_key if aws_secret_key else None,
+            max_pool_connections=max(DEFAULT_MAX_POOL_CONNECTIONS, self.config.max_parallel or 1),
         )
 
+        # The provider and its fixed request fields depend only on the model, so resolve them once
+        self.provider = self.config.model.split(".")[0]
+        self.base_body = {"input_type": "search_document"} if self.provider == "cohere" else {}
+
     def _normalize_vector(self, embeddings):
         """Normalize the embedding to a unit vector."""
         emb = np.array(embeddings)
         norm_emb = emb / np.linalg.norm(emb)
         return norm_emb.tolist()
 
-    def _get_embedding(self, text):
-        """Call out to Bedrock embedding endpoint."""
-
-        # Format input body based on the provider
-        provider = self.config.model.split(".")[0]
-        input_body = {}
-
-        if provider == "cohere":
-            input_body["input_type"] = "search_document"
-            input_body["texts"] = [text]
-        else:
-            # Amazon and other providers
-            input_body["inputText"] = text
-
-        body = json.dumps(input_body)
-
+    def _invoke_model(self, input_body):
+        """Send a request body to the Bedrock embedding endpoint and return the parsed response."""
         try:
             response = self.client.invoke_model(
-                body=body,
+                body=orjson.dumps(input_body),
                 modelId=self.config.model,
                 accept="application/json",
                 contentType="application/json",
             )
 
-            response_body = json.loads(response.get("body").read())
-
-            if provider == "cohere":
-                embeddings = response_body.get("embeddings")[0]
-            else:
-                embeddings = response_body.get("embedding")
-
-            return embeddings
+            return orjson.loads(response["body"].read())
         except Exception as e:
             raise ValueError(f"Error getting embedding from AWS Bedrock: {e}")
 
+    def _get_embedding(self, text):
+        """Call out to Bedrock embedding endpoint."""
+        text = text.translate(NEWLINE_TABLE)
+
+        # Format input body based on the provider
+        if self.provider == "cohere":
+            response_body = self._invoke_model({**self.base_body, "texts": [text]})
+            return response_body.get("embeddings")[0]
+
+        # Amazon and other providers
+        response_body = self._invoke_model({**self.base_body, "inputText": text})
+        return response_body.get("embedding")
+
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
         Get the embedding for the given text using AWS Bedrock.
@@ -96,3 +101,36 @@ class AWSBedrockEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         return self._get_embedding(text)
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get the embeddings for multiple texts using AWS Bedrock.
+
+        Cohere models embed up to 96 texts per request. Other providers have no batch API, so their
+        requests are sent concurrently, bounded by `max_parallel`.
+
+        Args:
+            texts (list): The texts to embed.
+        Returns:
+            list: The embedding vectors, in the same order as the input texts.
+        """
+        if not texts:
+            return []
+
+        if self.provider == "cohere":
+            texts = [text.translate(NEWLINE_TABLE) for text in texts]
+            for text in texts:
+                if len(text) > COHERE_MAX_TEXT_LENGTH:
+                    raise ValueError(
+                        f"Text exceeds the maximum length of {COHERE_MAX_TEXT_LENGTH} characters for Cohere models"
+                    )
+
+            embeddings = []
+            for start in range(0, len(texts), COHERE_MAX_BATCH_SIZE):
+                input_body = {**self.base_body, "texts": texts[start : start + COHERE_MAX_BATCH_SIZE]}
+                embeddings.extend(self._invoke_model(input_body).get("embeddings"))
+            return embeddings
+
+        max_workers = max(1, min(self.config.max_parallel or 1, len(texts)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._get_embedding, texts))
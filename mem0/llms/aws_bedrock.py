@@ -3,13 +3,9 @@ import os
 import re
 from typing import Any, Dict, List, Optional
 
-try:
-    import boto3
-except ImportError:
-    raise ImportError("The 'boto3' library is required. Please install it using 'pip install boto3'.")
-
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
+from mem0.utils.aws import get_bedrock_client
 
 PROVIDERS = ["ai21", "amazon", "anthropic", "cohere", "meta", "mistral", "stability", "writer"]
 
@@ -41,9 +37,8 @@ class AWSBedrockLLM(LLMBase):
         if hasattr(self.config, "aws_region"):
             aws_region = self.config.aws_region
 
-        self.client = boto3.client(
-            "bedrock-runtime",
-            region_name=aws_region,
+        self.client = get_bedrock_client(
+            aws_region,
             aws_access_key_id=aws_access_key if aws_access_key else None,
             aws_secret_access_key=aws_secret_key if aws_secret_key else None,
         )
@@ -54,6 +49,13 @@ class AWSBedrockLLM(LLMBase):
             "top_p": self.config.top_p,
         }
 
+        # The Converse inference settings depend only on the config, so build them once
+        self.inference_config = {
+            "temperature": self.model_kwargs["temperature"],
+            "maxTokens": self.model_kwargs["max_tokens_to_sample"],
+            "topP": self.model_kwargs["top_p"],
+        }
+
     def _format_messages(self, messages: List[Dict[str, str]]) -> str:
         """
         Formats a list of messages into the required prompt structure for the model.
@@ -224,22 +226,16 @@ class AWSBedrockLLM(LLMBase):
                 "content": [{"text": message["content"]} for message in messages],
             }
         ]
-        inference_config = {
-            "temperature": self.model_kwargs["temperature"],
-            "maxTokens": self.model_kwargs["max_tokens_to_sample"],
-            "topP": self.model_kwargs["top_p"],
+        request_body = {
+            "modelId": self.config.model,
+            "messages": messages,
+            "inferenceConfig": self.inference_config,
         }
-        tools_config = {"tools": self._convert_tool_format(tools)} if tools else None
-        
-        response = self.client.converse(
-            modelId=self.config.model,
-            messages=messages,
-            inferenceConfig=inference_config,
-            toolConfig=tools_config,
-        ) if tools_config else self.client.converse(
-            modelId=self.config.model,
-            messages=messages,
-            inferenceConfig=inference_config
-        )
+        if tools:
+            request_body["toolConfig"] = {"tools": self._convert_tool_format(tools)}
+        if self.config.performance_config:
+            request_body["performanceConfig"] = {"latency": self.config.performance_config}
+
+        response = self.client.converse(**request_body)
 
         return self._parse_response(response, tools)
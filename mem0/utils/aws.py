@@ -0,0 +1,44 @@
+from functools import lru_cache
+from typing import Optional
+
+# botocore's default connection pool size per client
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+
+@lru_cache(maxsize=None)
+def get_bedrock_client(
+    region_name: str,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+):
+    """
+    Return a shared Bedrock runtime client for the given region and credentials.
+
+    Building a client resolves the credential chain and loads endpoint data, so clients are cached and
+    reused by every Bedrock LLM and embedder configured with the same settings. boto3 clients are thread-safe.
+
+    Args:
+        region_name (str): AWS region of the Bedrock endpoint.
+        aws_access_key_id (str, optional): Access key. Falls back to the default credential chain when None.
+        aws_secret_access_key (str, optional): Secret key. Falls back to the default credential chain when None.
+        max_pool_connections (int, optional): Size of the client's HTTP connection pool. Callers that send
+            concurrent requests should pass at least their concurrency. Defaults to botocore's 10.
+
+    Returns:
+        botocore.client.BaseClient: The `bedrock-runtime` client.
+    """
+    # boto3 takes a noticeable time to import, so only load it once a Bedrock component is created
+    try:
+        import boto3
+        from botocore.config import Config
+    except ImportError:
+        raise ImportError("The 'boto3' library is required. Please install it using 'pip install boto3'.")
+
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=region_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        config=Config(max_pool_connections=max_pool_connections),
+    )
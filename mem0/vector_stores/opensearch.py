@@ -1,11 +1,17 @@
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 try:
-    from opensearchpy import OpenSearch, RequestsHttpConnection
+    import orjson
+    from opensearchpy import JSONSerializer, OpenSearch, RequestsHttpConnection, SerializationError
+    from opensearchpy.helpers import bulk
 except ImportError:
-    raise ImportError("OpenSearch requires extra dependencies. Install with `pip install opensearch-py`") from None
+    raise ImportError(
+        "OpenSearch requires extra dependencies. Install with `pip install opensearch-py orjson`"
+    ) from None
 
 from pydantic import BaseModel
 
@@ -14,6 +20,51 @@ from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
+# search and list only return ids and payloads, so the vectors are left out of their responses
+SOURCE_WITHOUT_VECTOR = {"excludes": ["vector_field"]}
+
+# Number of documents fetched per request when listing without a limit
+LIST_PAGE_SIZE = 1000
+
+# Maximum number of custom ids resolved to document ids per search request
+ID_LOOKUP_BATCH_SIZE = 1000
+
+# Payload fields that search and list can filter on
+FILTER_KEYS = ("user_id", "run_id", "agent_id")
+
+
+def _build_filter_clauses(filters: Optional[Dict]) -> List[Dict]:
+    """Build term clauses for the supported filter keys that have a value."""
+    filter_clauses = []
+    if filters:
+        for key in FILTER_KEYS:
+            value = filters.get(key)
+            if value:
+                filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+    return filter_clauses
+
+
+class OrjsonSerializer(JSONSerializer):
+    """Transport serializer that encodes requests and decodes responses with orjson."""
+
+    def loads(self, s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data: Any) -> Any:
+        # don't serialize strings
+        if isinstance(data, str):
+            return data
+
+        try:
+            return orjson.dumps(
+                data, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
+
 
 class OutputData(BaseModel):
     id: str
@@ -34,11 +85,14 @@ class OpenSearchDB(VectorStoreBase):
             use_ssl=config.use_ssl,
             verify_certs=config.verify_certs,
             connection_class=RequestsHttpConnection,
-            pool_maxsize=20,
+            # Keep enough pooled keep-alive connections for concurrent callers (e.g. AsyncMemory's worker threads)
+            pool_maxsize=config.pool_maxsize,
+            serializer=OrjsonSerializer(),
         )
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
+        self.knn_method = config.knn_method
         self.create_col(self.collection_name, self.embedding_model_dims)
 
     def create_index(self) -> None:
@@ -53,7 +107,7 @@ class OpenSearchDB(VectorStoreBase):
                     "vector_field": {
                         "type": "knn_vector",
                         "dimension": self.embedding_model_dims,
-                        "method": {"engine": "nmslib", "name": "hnsw", "space_type": "cosinesimil"},
+                        "method": self.knn_method,
                     },
                     "metadata": {"type": "object", "properties": {"user_id": {"type": "keyword"}}},
                 }
@@ -75,7 +129,7 @@ class OpenSearchDB(VectorStoreBase):
                     "vector_field": {
                         "type": "knn_vector",
                         "dimension": vector_size,
-                        "method": {"engine": "nmslib", "name": "hnsw", "space_type": "cosinesimil"},
+                        "method": self.knn_method,
                     },
                     "payload": {"type": "object"},
                     "id": {"type": "keyword"},
@@ -104,22 +158,33 @@ class OpenSearchDB(VectorStoreBase):
                     time.sleep(0.5)
 
     def insert(
-        self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
+        self,
+        vectors: Union[List[List[float]], np.ndarray],
+        payloads: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
     ) -> List[OutputData]:
-        """Insert vectors into the index."""
+        """Insert vectors into the index.
+
+        Vectors may also be given as a 2-D NumPy array, whose rows are serialized directly from the array buffer.
+        """
         if not ids:
             ids = [str(i) for i in range(len(vectors))]
 
         if payloads is None:
             payloads = [{} for _ in range(len(vectors))]
 
-        for i, (vec, id_) in enumerate(zip(vectors, ids)):
-            body = {
-                "vector_field": vec,
-                "payload": payloads[i],
-                "id": id_,
+        # Stream documents to the bulk API so only one chunk of actions is held in memory at a time.
+        # Document ids are left to OpenSearch (serverless vector collections reject custom ids), so the
+        # custom id is stored in the source.
+        actions = (
+            {
+                "_op_type": "index",
+                "_index": self.collection_name,
+                "_source": {"vector_field": vec, "payload": payload, "id": id_},
             }
-            self.client.index(index=self.collection_name, body=body)
+            for vec, payload, id_ in zip(vectors, payloads, ids)
+        )
+        bulk(self.client, actions, chunk_size=500, raise_on_error=True)
 
         results = []
 
@@ -130,42 +195,24 @@ class OpenSearchDB(VectorStoreBase):
     ) -> List[OutputData]:
         """Search for similar vectors using OpenSearch k-NN search with optional filters."""
 
-        # Base KNN query
-        knn_query = {
-            "knn": {
-                "vector_field": {
-                    "vector": vectors,
-                    "k": limit * 2,
-                }
-            }
-        }
-
-        # Start building the full query
-        query_body = {"size": limit * 2, "query": None}
-
-        # Prepare filter conditions if applicable
-        filter_clauses = []
-        if filters:
-            for key in ["user_id", "run_id", "agent_id"]:
-                value = filters.get(key)
-                if value:
-                    filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+        k = limit * 2
+        search_query = {"knn": {"vector_field": {"vector": vectors, "k": k}}}
 
-        # Combine knn with filters if needed
+        # Combine knn with filters only when there are any; the unfiltered knn query is sent as is
+        filter_clauses = _build_filter_clauses(filters)
         if filter_clauses:
-            query_body["query"] = {"bool": {"must": knn_query, "filter": filter_clauses}}
-        else:
-            query_body["query"] = knn_query
+            search_query = {"bool": {"must": search_query, "filter": filter_clauses}}
 
-        # Execute search
-        response = self.client.search(index=self.collection_name, body=query_body)
+        response = self.client.search(
+            index=self.collection_name, body={"size": k, "query": search_query, "_source": SOURCE_WITHOUT_VECTOR}
+        )
 
-        hits = response["hits"]["hits"]
-        results = [
-            OutputData(id=hit["_source"].get("id"), score=hit["_score"], payload=hit["_source"].get("payload", {}))
-            for hit in hits
+        return [
+            OutputData.model_construct(
+                id=hit["_source"].get("id"), score=hit["_score"], payload=hit["_source"].get("payload", {})
+            )
+            for hit in response["hits"]["hits"]
         ]
-        return results
 
     def delete(self, vector_id: str) -> None:
         """Delete a vector by custom ID."""
@@ -210,6 +257,48 @@ class OpenSearchDB(VectorStoreBase):
             except Exception:
                 pass
 
+    def _get_document_ids(self, vector_ids: List[str]) -> Dict[str, str]:
+        """Map custom IDs to OpenSearch document IDs, resolving up to ID_LOOKUP_BATCH_SIZE IDs per request."""
+        document_ids = {}
+        for start in range(0, len(vector_ids), ID_LOOKUP_BATCH_SIZE):
+            batch = vector_ids[start : start + ID_LOOKUP_BATCH_SIZE]
+            search_query = {"query": {"terms": {"id": batch}}, "size": len(batch), "_source": ["id"]}
+            response = self.client.search(index=self.collection_name, body=search_query)
+            for hit in response["hits"]["hits"]:
+                document_ids[hit["_source"]["id"]] = hit["_id"]
+        return document_ids
+
+    def delete_many(self, vector_ids: List[str]) -> None:
+        """Delete multiple vectors by custom ID, batching the ID lookups and deletes through the bulk API."""
+        document_ids = self._get_document_ids(vector_ids)
+        actions = (
+            {"_op_type": "delete", "_index": self.collection_name, "_id": opensearch_id}
+            for opensearch_id in document_ids.values()
+        )
+        bulk(self.client, actions, chunk_size=500, raise_on_error=True)
+
+    def update_many(self, items: List[Tuple[str, Optional[List[float]], Optional[Dict]]]) -> None:
+        """Update multiple vectors and payloads, given as (vector_id, vector, payload) tuples, in bulk API batches."""
+        document_ids = self._get_document_ids([vector_id for vector_id, _, _ in items])
+
+        def actions():
+            for vector_id, vector, payload in items:
+                doc = {}
+                if vector is not None:
+                    doc["vector_field"] = vector
+                if payload is not None:
+                    doc["payload"] = payload
+
+                if doc and vector_id in document_ids:
+                    yield {
+                        "_op_type": "update",
+                        "_index": self.collection_name,
+                        "_id": document_ids[vector_id],
+                        "doc": doc,
+                    }
+
+        bulk(self.client, actions(), chunk_size=500, raise_on_error=True)
+
     def get(self, vector_id: str) -> Optional[OutputData]:
         """Retrieve a vector by ID."""
         try:
@@ -227,7 +316,9 @@ class OpenSearchDB(VectorStoreBase):
             if not hits:
                 return None
 
-            return OutputData(id=hits[0]["_source"].get("id"), score=1.0, payload=hits[0]["_source"].get("payload", {}))
+            return OutputData.model_construct(
+                id=hits[0]["_source"].get("id"), score=1.0, payload=hits[0]["_source"].get("payload", {})
+            )
         except Exception as e:
             logger.error(f"Error retrieving vector {vector_id}: {str(e)}")
             return None
@@ -247,31 +338,42 @@ class OpenSearchDB(VectorStoreBase):
     def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[OutputData]:
         try:
             """List all memories with optional filters."""
-            query: Dict = {"query": {"match_all": {}}}
+            query: Dict = {"query": {"match_all": {}}, "_source": SOURCE_WITHOUT_VECTOR}
 
-            filter_clauses = []
-            if filters:
-                for key in ["user_id", "run_id", "agent_id"]:
-                    value = filters.get(key)
-                    if value:
-                        filter_clauses.append({"term": {f"payload.{key}.keyword": value}})
+            filter_clauses = _build_filter_clauses(filters)
 
             if filter_clauses:
                 query["query"] = {"bool": {"filter": filter_clauses}}
 
             if limit:
                 query["size"] = limit
-
-            response = self.client.search(index=self.collection_name, body=query)
-            hits = response["hits"]["hits"]
+                response = self.client.search(index=self.collection_name, body=query)
+                hits = response["hits"]["hits"]
+            else:
+                # Page through all matches with search_after. Custom ids are not guaranteed to be unique, so the
+                # document id breaks ties; otherwise documents sharing an id across a page boundary would be
+                # skipped. Point-in-time contexts are not used because serverless collections do not support them.
+                query["size"] = LIST_PAGE_SIZE
+                query["sort"] = [{"id": "asc"}, {"_id": "asc"}]
+                hits = []
+                while True:
+                    response = self.client.search(index=self.collection_name, body=query)
+                    page = response["hits"]["hits"]
+                    hits.extend(page)
+                    if len(page) < LIST_PAGE_SIZE:
+                        break
+                    query["search_after"] = page[-1]["sort"]
 
             return [
                 [
-                    OutputData(id=hit["_source"].get("id"), score=1.0, payload=hit["_source"].get("payload", {}))
+                    OutputData.model_construct(
+                        id=hit["_source"].get("id"), score=1.0, payload=hit["_source"].get("payload", {})
+                    )
                     for hit in hits
                 ]
             ]
-        except Exception:
+        except Exception as e:
+            logger.error(f"Error listing vectors from index {self.collection_name}: {str(e)}")
             return []
 
     def reset(self):
@@ -0,0 +1,109 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.aws_bedrock import AWSBedrockEmbedding
+from mem0.utils.aws import get_bedrock_client
+
+
+def _response(body):
+    stream = Mock()
+    stream.read.return_value = json.dumps(body)
+    return {"body": stream}
+
+
+@pytest.fixture
+def mock_bedrock_client():
+    with patch("mem0.embeddings.aws_bedrock.get_bedrock_client") as mock_get_client:
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        yield mock_client
+
+
+def test_embed_text(mock_bedrock_client):
+    config = BaseEmbedderConfig(model="amazon.titan-embed-text-v2:0")
+    embedder = AWSBedrockEmbedding(config)
+    mock_bedrock_client.invoke_model.return_value = _response({"embedding": [0.1, 0.2, 0.3]})
+
+    embedding = embedder.embed("Hello\r\nworld")
+
+    body = json.loads(mock_bedrock_client.invoke_model.call_args[1]["body"])
+    assert body == {"inputText": "Hello  world"}
+    assert embedding == [0.1, 0.2, 0.3]
+
+
+def test_embed_batch_cohere_single_request(mock_bedrock_client):
+    config = BaseEmbedderConfig(model="cohere.embed-english-v3")
+    embedder = AWSBedrockEmbedding(config)
+    mock_bedrock_client.invoke_model.return_value = _response({"embeddings": [[0.1], [0.2], [0.3]]})
+
+    embeddings = embedder.embed_batch(["a", "b", "c"])
+
+    mock_bedrock_client.invoke_model.assert_called_once()
+    body = json.loads(mock_bedrock_client.invoke_model.call_args[1]["body"])
+    assert body == {"input_type": "search_document", "texts": ["a", "b", "c"]}
+    assert embeddings == [[0.1], [0.2], [0.3]]
+
+
+def test_embed_batch_cohere_chunks_by_count(mock_bedrock_client):
+    config = BaseEmbedderConfig(model="cohere.embed-english-v3")
+    embedder = AWSBedrockEmbedding(config)
+    mock_bedrock_client.invoke_model.side_effect = [
+        _response({"embeddings": [[0.1]] * 96}),
+        _response({"embeddings": [[0.2]] * 4}),
+    ]
+
+    embeddings = embedder.embed_batch(["text"] * 100)
+
+    assert mock_bedrock_client.invoke_model.call_count == 2
+    assert embeddings == [[0.1]] * 96 + [[0.2]] * 4
+
+
+def test_embed_batch_cohere_rejects_long_text(mock_bedrock_client):
+    config = BaseEmbedderConfig(model="cohere.embed-english-v3")
+    embedder = AWSBedrockEmbedding(config)
+
+    with pytest.raises(ValueError):
+        embedder.embed_batch(["a" * 2049])
+
+    mock_bedrock_client.invoke_model.assert_not_called()
+
+
+def test_embed_batch_titan_preserves_order(mock_bedrock_client):
+    config = BaseEmbedderConfig(model="amazon.titan-embed-text-v2:0", max_parallel=4)
+    embedder = AWSBedrockEmbedding(config)
+
+    def invoke_model(body, **kwargs):
+        text = json.loads(body)["inputText"]
+        return _response({"embedding": [float(text)]})
+
+    mock_bedrock_client.invoke_model.side_effect = invoke_model
+
+    embeddings = embedder.embed_batch([str(i) for i in range(10)])
+
+    assert mock_bedrock_client.invoke_model.call_count == 10
+    assert embeddings == [[float(i)] for i in range(10)]
+
+
+def test_client_shared_across_instances():
+    get_bedrock_client.cache_clear()
+    with patch("boto3.client") as mock_client:
+        first = AWSBedrockEmbedding(BaseEmbedderConfig(aws_region="us-east-1"))
+        second = AWSBedrockEmbedding(BaseEmbedderConfig(aws_region="us-east-1"))
+        other = AWSBedrockEmbedding(BaseEmbedderConfig(aws_region="eu-west-1"))
+
+    assert first.client is second.client
+    assert mock_client.call_count == 2
+    assert other.client is mock_client.return_value
+    get_bedrock_client.cache_clear()
+
+
+def test_connection_pool_sized_to_max_parallel():
+    get_bedrock_client.cache_clear()
+    with patch("boto3.client") as mock_client:
+        AWSBedrockEmbedding(BaseEmbedderConfig(aws_region="us-east-1", max_parallel=32))
+
+    assert mock_client.call_args[1]["config"].max_pool_connections == 32
+    get_bedrock_client.cache_clear()
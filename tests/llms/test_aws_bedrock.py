@@ -0,0 +1,79 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.aws_bedrock import AWSBedrockLLM
+
+MODEL = "anthropic.claude-3-5-haiku-20241022-v1:0"
+
+
+@pytest.fixture
+def mock_bedrock_client():
+    with patch("mem0.llms.aws_bedrock.get_bedrock_client") as mock_get_client:
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        yield mock_client
+
+
+def test_generate_response_without_tools(mock_bedrock_client):
+    config = BaseLlmConfig(model=MODEL, temperature=0.7, max_tokens=100, top_p=1.0)
+    llm = AWSBedrockLLM(config)
+    messages = [{"role": "user", "content": "Hello, how are you?"}]
+
+    mock_bedrock_client.converse.return_value = {
+        "output": {"message": {"content": [{"text": "I'm doing well, thank you for asking!"}]}}
+    }
+
+    response = llm.generate_response(messages)
+
+    mock_bedrock_client.converse.assert_called_once_with(
+        modelId=MODEL,
+        messages=[{"role": "user", "content": [{"text": "Hello, how are you?"}]}],
+        inferenceConfig={"temperature": 0.7, "maxTokens": 100, "topP": 1.0},
+    )
+    assert response == "I'm doing well, thank you for asking!"
+
+
+def test_generate_response_with_tools(mock_bedrock_client):
+    config = BaseLlmConfig(model=MODEL)
+    llm = AWSBedrockLLM(config)
+    messages = [{"role": "user", "content": "Add a new memory: Today is a sunny day."}]
+    tools = [
+        {
+            "type": "function",
+            "function": {
+                "name": "add_memory",
+                "description": "Add a memory",
+                "parameters": {
+                    "type": "object",
+                    "properties": {"data": {"type": "string", "description": "Data to add to memory"}},
+                    "required": ["data"],
+                },
+            },
+        }
+    ]
+
+    mock_bedrock_client.converse.return_value = {
+        "output": {
+            "message": {"content": [{"toolUse": {"name": "add_memory", "input": {"data": "Today is a sunny day."}}}]}
+        }
+    }
+
+    response = llm.generate_response(messages, tools=tools)
+
+    tool_config = mock_bedrock_client.converse.call_args[1]["toolConfig"]
+    assert tool_config["tools"][0]["toolSpec"]["name"] == "add_memory"
+    assert tool_config["tools"][0]["toolSpec"]["inputSchema"]["json"]["required"] == ["data"]
+    assert response == {"tool_calls": [{"name": "add_memory", "arguments": {"data": "Today is a sunny day."}}]}
+
+
+def test_generate_response_with_performance_config(mock_bedrock_client):
+    config = BaseLlmConfig(model=MODEL, performance_config="optimized")
+    llm = AWSBedrockLLM(config)
+
+    mock_bedrock_client.converse.return_value = {"output": {"message": {"content": [{"text": "Hi"}]}}}
+
+    llm.generate_response([{"role": "user", "content": "Hello"}])
+
+    assert mock_bedrock_client.converse.call_args[1]["performanceConfig"] == {"latency": "optimized"}